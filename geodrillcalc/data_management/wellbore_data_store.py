@@ -1,10 +1,13 @@
 #!/usr/bin/env python
+from types import MappingProxyType
 import numpy as np
 import pandas as pd
 
 
 from ..utils.utils import getlogger, serialize_results
 from ..utils.data_preparation import initialise_aquifer_layer_table
+from ..utils.calc_utils import compute_aquifer_geometry
+from ..exceptions import InvalidGroundwaterLayerError
 
 
 class WellBoreDataStore:
@@ -17,10 +20,10 @@ class WellBoreDataStore:
 
     Attributes:
     -----------
-    table_attribute_names : list
+    table_attribute_names : tuple
         Names of data parameters required for the wellbore calculations.
 
-    initial_param_names : list
+    initial_param_names : tuple
         Names of initial parameters required for wellbore initialisation.
 
     outcome_params : list
@@ -39,6 +42,8 @@ class WellBoreDataStore:
     export_results_to_dict(self):
         Exports the results of the wellbore calculations to a dictionary.
 
+    export_result_tables(self):
+        Returns the result DataFrames of the finished stages without serialisation.
 
     get_casing_diameters(self, metric='metres', as_numpy=True):
         Returns casing diameters as a numpy array or pandas Series.
@@ -106,9 +111,84 @@ class WellBoreDataStore:
         "total_cost_table": pd.DataFrame
     }
 
+    # casing stage table schema, shared by the template and the casing pipeline
+    _CASING_STAGE_INDEX = pd.Index(["pre_collar",
+                                    "superficial_casing",
+                                    "pump_chamber_casing",
+                                    "intermediate_casing",
+                                    "screen_riser",
+                                    "screen"], name='casing_stages')
+    _CASING_STAGE_COLUMNS = ['top', 'bottom', 'casing', 'drill_bit']
+    _CASING_STAGE_TEMPLATE = pd.DataFrame(np.nan,
+                                          index=_CASING_STAGE_INDEX,
+                                          columns=_CASING_STAGE_COLUMNS)
+
+    # tables checked by _validate_initial_inputs, with the label used in its error message
+    _REQUIRED_TABLES = (('casing_diameter_table', 'casing diameter'),
+                        ('drilling_diameter_table', 'drilling diameter'),
+                        ('aquifer_layer_table', 'depth'))
+
+    # default diameter tables, built once from float64 arrays; instances receive copies
+    _DEFAULT_CASING_DIAMETER_TABLE = pd.DataFrame({
+        'inches': np.array([4, 4.5, 5, 5.5, 6.625, 7, 8.625, 9.625, 10.75, 13.375, 18.625, 20, 24, 30], dtype=np.float64),
+        'metres': np.array([0.1016, 0.1143, 0.127, 0.1397, 0.168275, 0.1778, 0.219075, 0.244475, 0.27305, 0.339725, 0.473075, 0.508, 0.6096, 0.762], dtype=np.float64),
+        'recommended_bit': np.array([0.190500, 0.215900, 0.215900, 0.228600, 0.269875, 0.269875, 0.311150, 0.349250, 0.381000, 0.444500, 0.609600, 0.609600, 0.711200, 0.914400], dtype=np.float64)
+    })
+    _DEFAULT_DRILLING_DIAMETER_TABLE = pd.DataFrame({
+        'inches': np.array([7.5, 8.5, 9, 9.5, 10.625, 11.625, 12.25, 13.75, 15, 16, 17.5, 18.5, 20, 22, 24, 26, 28, 30, 32, 34, 36], dtype=np.float64),
+        'metres': np.array([0.1905, 0.2159, 0.2286, 0.2413, 0.269875, 0.295275, 0.31115, 0.34925, 0.381, 0.4064, 0.4445, 0.4699, 0.508, 0.5588, 0.6096, 0.6604, 0.7112, 0.762, 0.8128, 0.8636, 0.9144], dtype=np.float64),
+        'recommended_screen': np.array([
+            0.1016, 0.1143, 0.127, 0.1397, 0.168275, 0.1778, 0.1778, 0.244475,
+            0.27305, 0.27305, 0.339725, 0.339725, 0.339725, 0.339725, 0.508,
+            0.508, 0.6096, 0.6096, 0.6096, 0.762, 0.762
+        ], dtype=np.float64)  # in metres
+    })
+
     # ---more stage outputs tbd ---
     # _setup_installation_calc_attributes must be updated
 
+    # derived attribute names per well type:
+    # (all attributes, initial params, table attributes, installation outputs, cost outputs)
+    _ATTRIBUTE_NAMES = {}
+    # physical constants assigned to every instance
+    _CONSTANT_DEFAULTS = {
+        'sand_face_velocity_production': .01,
+        'sand_face_velocity_injection': .003,
+        'net_to_gross_ratio_aquifer': 1,
+        'aquifer_average_porosity': .25,
+        'pipe_roughness_coeff': 100,
+    }
+    # per-instance starting values: every schema attribute None, then the constants
+    _DEFAULT_VALUES = {}
+    for _is_production in (True, False):
+        _installation_outputs = _OUTPUT_INSTALLATION_DEFAULT_ATTRIBUTES \
+            | (_OUTPUT_INSTALLATION_PRODUCTION_ATTRIBUTES if _is_production else {})
+        _all = _INPUT_ATTRIBUTES | _installation_outputs | _OUTPUT_COST_ATTRIBUTES
+        _ATTRIBUTE_NAMES[_is_production] = (
+            MappingProxyType(_all),  # shared by all instances, so exposed read-only
+            tuple(key for key, val in _INPUT_ATTRIBUTES.items() if val != pd.DataFrame),
+            tuple(key for key, val in _all.items() if val == pd.DataFrame),
+            tuple(_installation_outputs),
+            tuple(_OUTPUT_COST_ATTRIBUTES),
+        )
+        _DEFAULT_VALUES[_is_production] = dict.fromkeys(_all) | _CONSTANT_DEFAULTS
+    # attributes assignable per calculation stage, by stage name or number
+    _STAGE_ATTRIBUTE_SETS = {
+        _is_production: {'installation': frozenset(names[3]), 0: frozenset(names[3]),
+                         'cost': frozenset(names[4]), 1: frozenset(names[4])}
+        for _is_production, names in _ATTRIBUTE_NAMES.items()
+    }
+    del _is_production, _installation_outputs, _all
+
+    # fixed per-instance storage: the bookkeeping attributes plus every schema attribute of either well type
+    __slots__ = ('is_production_well', 'logger', 'attributes_assigned',
+                 'ready_for_calculation', 'ready_for_installation_output', 'ready_for_cost_output',
+                 'initial_param_names', 'table_attribute_names',
+                 'installation_output_attribute_names', 'cost_output_attribute_names',
+                 '_stage_attribute_sets', '_diameter_arrays', '_aquifer_index_map',
+                 *(_INPUT_ATTRIBUTES | _OUTPUT_INSTALLATION_DEFAULT_ATTRIBUTES
+                   | _OUTPUT_INSTALLATION_PRODUCTION_ATTRIBUTES | _OUTPUT_COST_ATTRIBUTES))
+
     def __init__(self, is_production_well: bool, logger=None):
         """
         Initialises the WellBoreDataStore with attributes for managing wellbore parameters.
@@ -124,6 +204,7 @@ class WellBoreDataStore:
         # metadata
         self._setup_installation_calc_attributes(is_production_well)
         self._assign_default_attributes()
+        self._aquifer_index_map = None
 
         # control flow:
         self.ready_for_calculation = False
@@ -146,19 +227,15 @@ class WellBoreDataStore:
             # Validate and assign target aquifer layer
             # self._validate_aquifer_layer(
             #     self.target_aquifer_layer, "Target aquifer")
-            target_index = self.aquifer_layer_table.index.get_loc(
-             self.target_aquifer_layer)
-            self.depth_to_top_screen = self.aquifer_layer_table.loc[
-                self.target_aquifer_layer]['depth_to_base']
-            self.aquifer_thickness = self.aquifer_layer_table.iloc[target_index +
-                                                                1]['depth_to_base'] - self.depth_to_top_screen
-
-            # Validate and assign top aquifer layer
-            # self._validate_aquifer_layer(
-            #     self.top_aquifer_layer, "Top aquifer layer")
-            # self._validate_top_aquifer_layer()
-            self.depth_to_aquifer_base = self.aquifer_layer_table.loc[
-                self.top_aquifer_layer]['depth_to_base']
+            # layer code -> row position, built once per table so lookups are plain dict hits
+            self._aquifer_index_map = {layer: position for position, layer
+                                       in enumerate(self.aquifer_layer_table.index)}
+            (self.depth_to_top_screen,
+             self.aquifer_thickness,
+             self.depth_to_aquifer_base) = compute_aquifer_geometry(
+                self.aquifer_layer_table['depth_to_base'].to_numpy(),
+                self._resolve_layer(self.target_aquifer_layer, "Target aquifer"),
+                self._resolve_layer(self.top_aquifer_layer, "Top aquifer layer"))
 
             # Final validation before calculation
             self._validate_initial_inputs()
@@ -167,6 +244,24 @@ class WellBoreDataStore:
             self.logger.exception(e)
             raise e
 
+    def reset(self):
+        """
+        Clears the calculation results and readiness flags so that the instance can be reused for another calculation.
+
+        The diameter tables are kept. Input parameters, derived inputs and constants return to the values of a
+        fresh instance, so nothing from the previous calculation is carried into the next one.
+        """
+        defaults = self._DEFAULT_VALUES[bool(self.is_production_well)]
+        for attr in self.initial_param_names:
+            setattr(self, attr, defaults[attr])
+        for attr in (*self.installation_output_attribute_names, *self.cost_output_attribute_names):
+            setattr(self, attr, None)
+        self._aquifer_index_map = None
+        self.casing_stage_table = self._initialise_casing_stage_table()
+        self.ready_for_calculation = False
+        self.ready_for_installation_output = False
+        self.ready_for_cost_output = False
+
     
 # ------export utils----------------------
     def export_installation_results_to_dict(self,
@@ -230,53 +325,60 @@ class WellBoreDataStore:
         # Convert to JSON if requested
 
         return combined_results
+
+    def export_result_tables(self):
+        """
+        Exports the result tables of the finished calculation stages as DataFrames, without serialisation.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping attribute names to the result DataFrames, e.g. 'casing_stage_table' and
+            'cost_estimation_table'. The frames are returned as stored, so callers must copy them before modifying.
+
+        Notes
+        -----
+        Unlike `export_results_to_dict`, the tables are not converted to records and NaN values are kept,
+        which makes this the cheaper path for consumers that work on DataFrames or their numpy columns directly.
+        """
+        names = ()
+        if self.ready_for_installation_output:
+            names += self.installation_output_attribute_names
+        if self.ready_for_cost_output:
+            names += self.cost_output_attribute_names
+        return {name: value for name in names
+                if isinstance(value := getattr(self, name), pd.DataFrame)}
     
 # ------------initialisation utility private methods----------------------------------------
 
     def _setup_installation_calc_attributes(self,
                                             is_production_well: bool):
-        self._all_attributes = self._INPUT_ATTRIBUTES \
-            | self._OUTPUT_INSTALLATION_DEFAULT_ATTRIBUTES \
-            | (self._OUTPUT_INSTALLATION_PRODUCTION_ATTRIBUTES if is_production_well else {}) \
-            | self._OUTPUT_COST_ATTRIBUTES
-        self.initial_param_names = [
-            key for key, val in self._INPUT_ATTRIBUTES.items() if val != pd.DataFrame]
-        self.table_attribute_names = [
-            key for key, val in self._all_attributes.items() if val == pd.DataFrame]
-
-        # customise stage output attributes here
-        self.installation_output_attribute_names = [
-            *self._OUTPUT_INSTALLATION_DEFAULT_ATTRIBUTES.keys()]
-        if is_production_well:
-            self.installation_output_attribute_names += [
-                *self._OUTPUT_INSTALLATION_PRODUCTION_ATTRIBUTES.keys()]
-        self.cost_output_attribute_names = [
-            *self._OUTPUT_COST_ATTRIBUTES.keys()]
+        # the name lists are derived once per well type at class definition; instances share them
+        (_,
+         self.initial_param_names,
+         self.table_attribute_names,
+         self.installation_output_attribute_names,
+         self.cost_output_attribute_names) = self._ATTRIBUTE_NAMES[bool(is_production_well)]
+        self._stage_attribute_sets = self._STAGE_ATTRIBUTE_SETS[bool(is_production_well)]
 
         self.attributes_assigned = True
 
+    @property
+    def _all_attributes(self):
+        # read from the class rather than stored on the instance: a mappingproxy cannot be copied or pickled
+        return self._ATTRIBUTE_NAMES[bool(self.is_production_well)][0]
+
     def _assign_default_attributes(self):
         if not self.attributes_assigned:
             raise RuntimeError("Attributes must be initialised before setting default values." +
                                "Call '_setup_calc_attributes()' first.")
-        for attr in self._all_attributes:
-            setattr(self, attr, None)
-        # ----------------------------------------------------------------
-        # table initialisation
-        self.casing_diameter_table = pd.DataFrame(
-            columns=['inches', 'metres', 'recommended_bit'])
-        self.drilling_diameter_table = pd.DataFrame(
-            columns=['inches', 'metres', 'recommended_screen'])
+        # every schema attribute starts as None, except the constants
+        for attr, value in self._DEFAULT_VALUES[bool(self.is_production_well)].items():
+            setattr(self, attr, value)
+        # the diameter tables are assigned by _initialise_diameter_tables below
         self.aquifer_layer_table = pd.DataFrame(
             columns=["aquifer_layer", "is_aquifer", "depth_to_base"])
         # ----------------------------------------------------------------
-        # constants initialisation
-        self.sand_face_velocity_production = .01
-        self.sand_face_velocity_injection = .003
-        self.net_to_gross_ratio_aquifer = 1
-        self.aquifer_average_porosity = .25
-        self.pipe_roughness_coeff = 100
-        # ----------------------------------------------------------------
         self.casing_stage_table = self._initialise_casing_stage_table()
         # ----------------------------------------------------------------
         self._initialise_diameter_tables()
@@ -284,48 +386,36 @@ class WellBoreDataStore:
     def _initialise_diameter_tables(self,
                                    casing_diameter_table=None,
                                    drilling_diameter_table=None,):
-        self.casing_diameter_table = casing_diameter_table or pd.DataFrame({
-            'inches': [4, 4.5, 5, 5.5, 6.625, 7, 8.625, 9.625, 10.75, 13.375, 18.625, 20, 24, 30],
-            'metres': [0.1016, 0.1143, 0.127, 0.1397, 0.168275, 0.1778, 0.219075, 0.244475, 0.27305, 0.339725, 0.473075, 0.508, 0.6096, 0.762],
-            'recommended_bit': [0.190500, 0.215900, 0.215900, 0.228600, 0.269875, 0.269875, 0.311150, 0.349250, 0.381000, 0.444500, 0.609600, 0.609600, 0.711200, 0.914400]
-        })
-
-        self.drilling_diameter_table = drilling_diameter_table or pd.DataFrame({
-            'inches': [7.5, 8.5, 9, 9.5, 10.625, 11.625, 12.25, 13.75, 15, 16, 17.5, 18.5, 20, 22, 24, 26, 28, 30, 32, 34, 36],
-            'metres': [0.1905, 0.2159, 0.2286, 0.2413, 0.269875, 0.295275, 0.31115, 0.34925, 0.381, 0.4064, 0.4445, 0.4699, 0.508, 0.5588, 0.6096, 0.6604, 0.7112, 0.762, 0.8128, 0.8636, 0.9144],
-            'recommended_screen': [
-                0.1016, 0.1143, 0.127, 0.1397, 0.168275, 0.1778, 0.1778, 0.244475,
-                0.27305, 0.27305, 0.339725, 0.339725, 0.339725, 0.339725, 0.508,
-                0.508, 0.6096, 0.6096, 0.6096, 0.762, 0.762
-            ]  # in metres
-        })
+        # the defaults are copied so that an instance never modifies the shared class tables
+        if casing_diameter_table is None:
+            casing_diameter_table = self._DEFAULT_CASING_DIAMETER_TABLE.copy()
+        if drilling_diameter_table is None:
+            drilling_diameter_table = self._DEFAULT_DRILLING_DIAMETER_TABLE.copy()
+        self.casing_diameter_table = casing_diameter_table
+        self.drilling_diameter_table = drilling_diameter_table
+        self._cache_diameter_arrays()
+
+    def _cache_diameter_arrays(self):
+        """
+        Caches read-only numpy views of the diameter columns, keyed by (casing_or_drilling, column).
+        Every column of both tables is cached, so the calculation pipelines can work on plain arrays.
+        Must be called again whenever a diameter table is replaced.
+        """
+        self._diameter_arrays = {}
+        for casing_or_drilling, table in (('casing', self.casing_diameter_table),
+                                          ('drilling', self.drilling_diameter_table)):
+            for metric in table.columns:
+                # zero-copy for float64 columns; the read-only flag is set on a view so the table stays writeable
+                array = table[metric].to_numpy(dtype=np.float64, copy=False).view()
+                array.flags.writeable = False
+                self._diameter_arrays[(casing_or_drilling, metric)] = array
 
     def _initialise_casing_stage_table(self):
-        casing_stages = ["pre_collar",
-                         "superficial_casing",
-                         "pump_chamber_casing",
-                         "intermediate_casing",
-                         "screen_riser",
-                         "screen"]
-        casing_columns = ['top', 'bottom', 'casing', 'drill_bit']
-        nan_array = np.full((len(casing_stages), len(casing_columns)), np.nan)
-        casing_df = pd.DataFrame(nan_array,
-                                 columns=casing_columns).set_index(pd.Index(casing_stages, name='casing_stages'))
-        return casing_df
+        # copying the prebuilt all-NaN template is cheaper than running the DataFrame constructor
+        return self._CASING_STAGE_TEMPLATE.copy()
 
     def _initialise_aquifer_layer_table(self, aquifer_layer_table):
-        if not isinstance(aquifer_layer_table, pd.DataFrame):
-            try:
-                aquifer_layer_table_pd = pd.DataFrame(aquifer_layer_table)
-            except ValueError as e:
-                self.logger.error(e)
-                raise e
-        else:
-            aquifer_layer_table_pd = aquifer_layer_table.copy()
-        columns = ["aquifer_layer", "is_aquifer", "depth_to_base"]
-        aquifer_layer_table_pd.columns = columns
-        self.aquifer_layer_table = aquifer_layer_table_pd.set_index(
-            "aquifer_layer")  # index as the aquifer code
+        self.aquifer_layer_table = initialise_aquifer_layer_table(aquifer_layer_table)
 
     def _assign_initial_input_params(self, arg_names: list, **kwargs):
         for arg_name in arg_names:
@@ -351,21 +441,14 @@ class WellBoreDataStore:
         ValueError
             If the stage is unknown.
         """
-        stage_mapping = {
-            'installation': self.installation_output_attribute_names,
-            0: self.installation_output_attribute_names,
-            'cost': self.cost_output_attribute_names,
-            1: self.cost_output_attribute_names
-        }
-
-        # Retrieve the appropriate attribute names list based on the stage
-        attribute_name_list = stage_mapping[stage]
-        if attribute_name_list is None:
+        # Retrieve the appropriate attribute name set based on the stage
+        attribute_names = self._stage_attribute_sets.get(stage)
+        if attribute_names is None:
             raise ValueError(f"Unknown stage: {stage}")
 
         # Assign values to the corresponding attributes
         for arg_name, value in kwargs.items():
-            if arg_name in attribute_name_list and value is not None:
+            if arg_name in attribute_names and value is not None:
                 setattr(self, arg_name, value)
 
     # TODO: The method directly accesses specific layers (LMTA, LTA, QA_UTQA) using .loc.
@@ -407,38 +490,54 @@ class WellBoreDataStore:
     #         raise ValueError(
     #             f"Top aquifer layer must be either '100qa' or '102utqa', but received '{self.top_aquifer_layer}'.")
 
+    def _resolve_layer(self, layer_name, context):
+        """
+        Returns the row position of an aquifer layer, checking and resolving it with a single lookup.
+
+        Raises
+        ------
+        InvalidGroundwaterLayerError
+            If the layer is not present in the aquifer layer table.
+        """
+        position = self._aquifer_index_map.get(layer_name)
+        if position is None:
+            raise InvalidGroundwaterLayerError(
+                f"{context} '{layer_name}' not found in the aquifer layers: {list(self._aquifer_index_map)}")
+        return position
+
     def _validate_initial_inputs(self):
         """ 
         #TODO: write in DRY util method
         Performs validation checks for the initial input data
         """
 
-        if not isinstance(self.casing_diameter_table, pd.DataFrame) or self.casing_diameter_table.empty:
-            raise ValueError("Invalid or missing casing diameter data")
-
-        if not isinstance(self.drilling_diameter_table, pd.DataFrame) or self.drilling_diameter_table.empty:
-            raise ValueError("Invalid or missing drilling diameter data")
-
-        if not isinstance(self.aquifer_layer_table, pd.DataFrame) or self.aquifer_layer_table.empty:
-            raise ValueError("Invalid or missing depth data")
+        for table_name, label in self._REQUIRED_TABLES:
+            table = getattr(self, table_name)
+            if not isinstance(table, pd.DataFrame) or table.empty:
+                raise ValueError(f"Invalid or missing {label} data")
 
-        for param in self.initial_param_names:
-            if getattr(self, param) is None:
-                raise ValueError(
-                    f"Invalid or missing initial parameter at {param}")
+        # every missing parameter is reported at once
+        missing = [param for param in self.initial_param_names if getattr(self, param) is None]
+        if missing:
+            raise ValueError(
+                f"Invalid or missing initial parameter(s): {', '.join(missing)}")
 
 # -------diameter table utils-----------------------
     def _get_diameter_table(self, casing_or_drilling: str, metric='metres', as_numpy=True):
         """
         casing_or_drilling: self.casing_diameter_table if 'casing' else self.drilling_diameter_table
-        metric: if 'metres' or 'inches', returns the corresponding column. Otherwise, returns the whole dataset
-        as_numpy: if True, casts the returning dataset to numpy. This argument is ignored when metric is set to None, 
+        metric: the column to return, e.g. 'metres' or 'inches'. If None or not a column, returns the whole dataset
+        as_numpy: if True, returns the cached read-only numpy array. This argument is ignored when metric is set to None, 
         """
-        dset = self.casing_diameter_table if casing_or_drilling == 'casing' else self.drilling_diameter_table
+        table_key = 'casing' if casing_or_drilling == 'casing' else 'drilling'
+        if as_numpy:
+            cached = self._diameter_arrays.get((table_key, metric))
+            if cached is not None:
+                return cached
+        dset = self.casing_diameter_table if table_key == 'casing' else self.drilling_diameter_table
         if metric is None or metric not in dset.columns:
             return dset
-        diam = dset['metres'] if metric == 'metres' else dset['inches']
-        return np.array(diam) if as_numpy else diam
+        return dset[metric]
 
     def get_casing_diameters(self, metric='metres', as_numpy=True):
         """
@@ -458,6 +557,24 @@ class WellBoreDataStore:
         """
         return self._get_diameter_table(casing_or_drilling='casing', metric=metric, as_numpy=as_numpy)
 
+    def get_diameter_column(self, casing_or_drilling: str, column: str) -> np.ndarray:
+        """
+        Returns a column of the casing or drilling diameter table as a cached read-only numpy array.
+
+        Parameters
+        ----------
+        casing_or_drilling : str
+            'casing' for the casing diameter table, 'drilling' for the drilling diameter table.
+        column : str
+            The column name, e.g. 'metres', 'inches', 'recommended_bit' or 'recommended_screen'.
+
+        Returns
+        -------
+        np.ndarray
+            The column values as float64.
+        """
+        return self._diameter_arrays[(casing_or_drilling, column)]
+
     def get_drilling_diameters(self, metric='metres', as_numpy=True):
         """
         Returns drilling diameters based on the specified metric.
@@ -33,4 +33,6 @@ class InvalidCasingDesignError(GeodrillCalcError):
         )
         super().__init__(self.message)
 
-
+class InvalidWellboreInputError(GeodrillCalcError, ValueError):
+    """Raised when a wellbore input parameter lies outside its physically valid range."""
+    pass
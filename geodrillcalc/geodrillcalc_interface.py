@@ -26,10 +26,15 @@ from .wellborecalc.wellborecalc_pipeline import CalcPipeline
 
 from .wellborecost.wellborecost_pipeline import CostPipeline
 
-from .utils.utils import getlogger
+from .utils.utils import getlogger, make_hashable, frames_to_components, components_to_frames
 from .utils.validation import check_initial_calculation_feasibility
 from .utils.data_preparation import initialise_aquifer_layer_table
 from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+import copy
+import logging
 
 
 
@@ -46,8 +51,8 @@ class GeoDrillCalcInterface:
         An instance of the CalcPipeline class for performing wellbore calculations.
     costpl : CostPipeline
         An instance of the CostPipeline class for performing wellbore cost calculations.
-    is_production_well : bool
-        A boolean indicating whether the pump used is for production or injection.
+    result_cache_size : int
+        Maximum number of calculation results memoised by the instance; 0 (the default) disables the cache.
     logger : Logger
         A logger for handling log messages in the GeoDrillCalcInterface class.
 
@@ -76,13 +81,39 @@ class GeoDrillCalcInterface:
     when using the 'calculate_and_return_wellbore_parameters' method.
     """
 
-    def __init__(self, is_production_well: Optional[bool] = None, log_level='INFO'):
+    __slots__ = ('wbd', 'calcpl', 'costpl', 'logger', '_result_cache', '_result_cache_size')
+
+    def __init__(self, is_production_well: Optional[bool] = None, log_level='INFO', result_cache_size: int = 0):
+        """
+        Parameters
+        ----------
+        is_production_well : bool, optional
+            Deprecated and ignored; the well type is passed to `calculate_and_return_wellbore_parameters`.
+        log_level : str, optional
+            The logging level, default is 'INFO'.
+        result_cache_size : int, optional
+            Maximum number of calculation results memoised by the instance, default is 0 (no caching).
+            Caching pays off only when equal inputs are calculated repeatedly; every miss deep-copies the result.
+        """
         self.wbd:WellBoreDataStore = None
         self.calcpl:CalcPipeline = None
         self.costpl:CostPipeline = None
-        self.is_production_well = is_production_well
         self.logger = getlogger(log_level)
-
+        self._result_cache = OrderedDict()
+        self.result_cache_size = result_cache_size
+
+    @property
+    def result_cache_size(self) -> int:
+        return self._result_cache_size
+
+    @result_cache_size.setter
+    def result_cache_size(self, size: int):
+        if size < 0:
+            raise ValueError(f"result_cache_size must be zero or positive, got {size}")
+        self._result_cache_size = size
+        # shrinking the limit evicts the least recently used entries at once
+        while len(self._result_cache) > size:
+            self._result_cache.popitem(last=False)
 
     def calculate_and_return_wellbore_parameters(self,
                                                  is_production_well: bool,
@@ -110,7 +141,34 @@ class GeoDrillCalcInterface:
         -------
         WellBoreDataStore
             An instance containing the results.
+
+        Notes
+        -----
+        The pipelines are deterministic, so when `result_cache_size` is positive, results are memoised per
+        instance on the full set of inputs. Repeated calls with equal inputs return a copy of the cached
+        WellBoreDataStore without re-running the pipelines; `calcpl` and `costpl` are set to None in that case.
+        The returned store is reused and reset in place by the next call for the same well type,
+        so copy it if it must outlive that call.
         """
+        cache_key = None  # inputs that cannot be hashed, or a disabled cache, are never cached
+        if self._result_cache_size:
+            try:
+                cache_key = make_hashable((is_production_well,
+                                           aquifer_layer_table,
+                                           initial_input_params,
+                                           cost_rates,
+                                           margin_rates))
+                hash(cache_key)
+            except TypeError:
+                cache_key = None
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            self.wbd = copy.deepcopy(self._result_cache[cache_key])
+            # no pipeline ran for this store, so none is left pointing at an older one
+            self.calcpl = None
+            self.costpl = None
+            self._log_outcome()
+            return self.wbd
         try:
             self._initialise_wbd(is_production_well, 
                             aquifer_layer_table,                                                    
@@ -125,6 +183,7 @@ class GeoDrillCalcInterface:
             self.costpl.calc_pipeline()
             
             self._log_outcome()
+            self._cache_result(cache_key)
             return self.wbd
         except ValueError as e:
             raise e
@@ -134,6 +193,35 @@ class GeoDrillCalcInterface:
 
     
     
+    def calculate_batch(self, inputs: list, n_workers: Optional[int] = None) -> list:
+        """
+        Runs the calculation for many input sets in parallel worker processes.
+
+        Parameters
+        ----------
+        inputs : list of tuple
+            Each item holds the positional arguments of `calculate_and_return_wellbore_parameters`,
+            i.e. (is_production_well, aquifer_layer_table, initial_input_params[, cost_rates[, margin_rates]]).
+        n_workers : int, optional
+            The number of worker processes. Defaults to the number of CPUs.
+
+        Returns
+        -------
+        list of dict
+            The exported results (as returned by `export_results_to_dict`) for each input set, in input order.
+
+        Notes
+        -----
+        Each worker uses a fresh, uncached GeoDrillCalcInterface with this instance's log level, and only the
+        exported dictionaries are sent back to the parent process, with numeric tables packed as arrays in transit.
+        The instance's own state and result cache are not modified.
+        """
+        log_level = self.logger.getEffectiveLevel()
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return [components_to_frames(result)
+                    for result in executor.map(_calculate_and_export,
+                                               [(log_level, tuple(args)) for args in inputs])]
+
     def _initialise_wbd(self, is_production_well, aquifer_layer_table, initial_input_params):
         """
         Initialises and prepares the instance for the pipeline.
@@ -149,23 +237,36 @@ class GeoDrillCalcInterface:
         """
         aquifer_pd = initialise_aquifer_layer_table(aquifer_layer_table)
         check_initial_calculation_feasibility(aquifer_pd)
-        if self.is_production_well is None:
-            self.is_production_well = is_production_well
-        if self.wbd is None:
+        # the data store's output attributes depend on the well type, so it is only reused for the same type
+        if self.wbd is None or self.wbd.is_production_well != is_production_well:
             self.wbd = WellBoreDataStore(is_production_well)
+        else:
+            self.wbd.reset()
         self.wbd._initialise_calculation_parameters(aquifer_layer_table=aquifer_layer_table,
                                                     **initial_input_params)
 
 
+    def _cache_result(self, cache_key):
+        """
+        Stores a copy of the current WellBoreDataStore under the given key, evicting the least recently used entry.
+        """
+        if cache_key is None:
+            return
+        self._result_cache[cache_key] = copy.deepcopy(self.wbd)
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+
     def _log_outcome(self):
         """
         Logs the outcome of the pipeline.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if not self.wbd.ready_for_calculation or not self.wbd.ready_for_installation_output:
             return
-        for key in self.wbd.installation_output_attribute_names:
-            value = getattr(self.wbd, key)
-            self.logger.info(f"{key}: {value}")
+        names = self.wbd.installation_output_attribute_names
+        for key, value in zip(names, attrgetter(*names)(self.wbd)):
+            self.logger.info("%s: %s", key, value)
 
     def set_loglevel(self, loglevel: int | str):
         """
@@ -185,59 +286,51 @@ class GeoDrillCalcInterface:
         Parameters
         ----------
         to_json : bool, optional
-            If True, returns the results as a JSON string. Defaults to False.
+            Deprecated and ignored; JSON output is no longer supported and a dictionary is always returned.
 
         Returns
         -------
-        dict or str
-            A dictionary containing the combined results from both stages, or a JSON string if `to_json` is True.
+        dict
+            A dictionary containing the installation specification results.
         """
-        return self.wbd.export_installation_results_to_dict(to_json=to_json)
+        if to_json:
+            self.logger.warning("to_json is no longer supported; returning a dictionary")
+        return self.wbd.export_installation_results_to_dict()
     
     def export_cost_results_to_dict(self):
         """
         Retrieves the installation cost results from the instance's WellBoreDataStore attribute.
 
-        Parameters
-        ----------
-        to_json : bool, optional
-            If True, returns the results as a JSON string. Defaults to False.
-
         Returns
         -------
-        dict or str
-            A dictionary containing the combined results from both stages, or a JSON string if `to_json` is True.
+        dict
+            A dictionary containing the installation cost results.
         """
         return self.wbd.export_cost_results_to_dict()
 
-    #TODO: disable support for json outputs
     def export_results_to_dict(self):
         """
         Retrieves the calculated results from the instance's WellBoreDataStore attribute.
 
-        Parameters
-        ----------
-        to_json : bool, optional
-            If True, returns the results as a JSON string. Defaults to False.
-
         Returns
         -------
-        dict or str
-            A dictionary containing the installation specification results, or a JSON string if `to_json` is True.
+        dict
+            A dictionary with the installation specification results under 'installation_results'
+            and the installation cost results under 'cost_results'.
         """
         combined_results = {}
 
         try:
             combined_results["installation_results"] = self.wbd.export_installation_results_to_dict()
         except Exception as e:
-            self.logger.error(f"Failed to retrieve installation results: {e}")
+            self.logger.error("Failed to retrieve installation results: %s", e)
             combined_results["installation_results"] = None
             raise RuntimeError from e
 
         try:
             combined_results["cost_results"] = self.wbd.export_cost_results_to_dict()
         except Exception as e:
-            self.logger.error(f"Failed to retrieve cost results: {e}")
+            self.logger.error("Failed to retrieve cost results: %s", e)
             combined_results["cost_results"] = None
             raise RuntimeError from e
 
@@ -246,3 +339,25 @@ class GeoDrillCalcInterface:
     
 
 
+def _calculate_and_export(job):
+    """
+    Worker entry point for GeoDrillCalcInterface.calculate_batch.
+
+    Parameters
+    ----------
+    job : tuple
+        A (log_level, args) pair, where args are the positional arguments of
+        `calculate_and_return_wellbore_parameters`.
+
+    Returns
+    -------
+    dict
+        The combined installation and cost results for the input set.
+    """
+    log_level, args = job
+    # the worker's interface is discarded after one job, so caching its result would be wasted work
+    interface = GeoDrillCalcInterface(result_cache_size=0)
+    interface.set_loglevel(log_level)
+    interface.calculate_and_return_wellbore_parameters(*args)
+    # numeric tables travel back to the parent as plain arrays
+    return frames_to_components(interface.export_results_to_dict())
@@ -1,3 +1,4 @@
+import weakref
 import numpy as np
 import pandas as pd
 from ..exceptions import InvalidCasingDesignError
@@ -26,19 +27,78 @@ def find_nearest_value(val,
     -------
     float
         The nearest value in the 'array' relative to 'val'. If 'one_size_larger' is True and a larger or equal value is not found, returns the next nominal casing size larger.
+
+    Raises
+    ------
+    ValueError
+        If 'larger_than_or_equal_val' is True and no qualifying value exists in 'array'.
     """
-    #print(f'{__name__} invoked, args: {val, array, one_size_larger}')
-    # casting applied
-    if larger_than_or_equal_val:
-        valid_vals = array[array >
-                           val] if one_size_larger else array[array >= val]
-    else:
-        valid_vals = array
+    array = np.asarray(array, dtype=np.float64)
+    if not larger_than_or_equal_val:
+        # absolute differences computed in place, leaving a single temporary
+        diffs = array - val
+        np.abs(diffs, out=diffs)
+        return array[diffs.argmin()]
+    # every qualifying value lies at or above 'val', so the nearest one is the first
+    # qualifying entry of the sorted array
+    sorted_array = _get_sorted(array)
+    idx = np.searchsorted(sorted_array, val, side='right' if one_size_larger else 'left')
+    if idx == len(sorted_array):
+        raise ValueError(f"No value larger than {val} found in the input array.")
+    return sorted_array[idx]
 
-    #print(f'valid_array_items: {valid_vals}')
-    nearest_idx = np.argmin(np.abs(valid_vals - val))
-    #print(f'retrieving index: {nearest_idx} from {valid_vals}')
-    return valid_vals[nearest_idx]
+
+
+def nearest_batch(vals, array, larger_than_or_equal_val=True, one_size_larger=False) -> np.ndarray:
+    """
+    Vectorised counterpart of find_nearest_value for many target values against the same array.
+
+    Parameters
+    ----------
+    vals : numpy.ndarray
+        The target values for which the nearest values are to be found.
+    array : numpy.ndarray
+        The array of values to search.
+    larger_than_or_equal_val : bool, optional
+        If True, only values larger than or equal to each target qualify. Default is True.
+    one_size_larger : bool, optional
+        If True (and 'larger_than_or_equal_val' is True), only values strictly larger than each target qualify.
+        Default is False.
+
+    Returns
+    -------
+    numpy.ndarray
+        The nearest qualifying value for each element of 'vals'.
+        NaN where the target is NaN or no qualifying value exists.
+    """
+    vals = np.asarray(vals, dtype=np.float64)
+    array = np.asarray(array, dtype=np.float64)
+    if not larger_than_or_equal_val:
+        diffs = np.abs(array[None, :] - vals[:, None])
+        return np.where(np.isnan(vals), np.nan, array[diffs.argmin(axis=1)])
+    sorted_array = _get_sorted(array)
+    idx = np.searchsorted(sorted_array, vals, side='right' if one_size_larger else 'left')
+    valid = ~np.isnan(vals) & (idx < len(sorted_array))
+    return np.where(valid, sorted_array[np.clip(idx, 0, len(sorted_array) - 1)], np.nan)
+
+# sorted copies of the (static) nominal size tables, keyed by their raw bytes
+_SORTED_CACHE: dict = {}
+_SORTED_CACHE_SIZE = 16
+
+
+def _get_sorted(array: np.ndarray) -> np.ndarray:
+    """
+    Returns a sorted copy of a float64 array, reusing the copy made for an identical array.
+    """
+    key = array.tobytes()
+    sorted_array = _SORTED_CACHE.get(key)
+    if sorted_array is None:
+        if len(_SORTED_CACHE) >= _SORTED_CACHE_SIZE:
+            _SORTED_CACHE.clear()
+        sorted_array = np.sort(array)
+        sorted_array.flags.writeable = False
+        _SORTED_CACHE[key] = sorted_array
+    return sorted_array
 
 
 def find_next_largest_value(val, array):
@@ -50,23 +110,84 @@ def find_next_largest_value(val, array):
     val : float
         The target value for which the next nominal casing size larger is to be found.
     array : list or numpy.ndarray
-        The array of values in which to search for the next larger value.
+        The array of values in which to search for the next larger value. It does not need to be sorted.
 
     Returns
     -------
     float
         The next nominal casing size larger than 'val' in the 'array'.
+
+    Raises
+    ------
+    ValueError
+        If the array is empty or contains no value larger than 'val'.
     """
     if not isinstance(array, (list, np.ndarray)):
         raise TypeError("Input array must be a list or numpy.ndarray.")
     if len(array) == 0:
         raise ValueError("Input array is empty.")
-    if not isinstance(array, np.ndarray):
-        array = np.array(array)
-    return find_nearest_value(val,
-                              array,
-                              one_size_larger=True)
+    array = _get_sorted(np.asarray(array, dtype=np.float64))
+    idx = np.searchsorted(array, val, side='right')
+    if idx == len(array):
+        raise ValueError(f"No value larger than {val} found in the input array.")
+    return array[idx]
+
+
+def find_next_largest_vec(values, sorted_choices: np.ndarray) -> np.ndarray:
+    """
+    Vectorised counterpart of find_next_largest_value.
 
+    For each element of 'values', finds the next nominal casing size strictly larger than it.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The target values for which the next larger nominal sizes are to be found. NaN entries are allowed.
+    sorted_choices : numpy.ndarray
+        The nominal sizes to choose from, sorted in ascending order.
+
+    Returns
+    -------
+    numpy.ndarray
+        The next larger nominal size for each element of 'values'.
+        NaN where the input is NaN or no larger size exists in 'sorted_choices'.
+    """
+    values = np.asarray(values, dtype=float)
+    idx = np.searchsorted(sorted_choices, values, side='right')
+    valid = ~np.isnan(values) & (idx < len(sorted_choices))
+    return np.where(valid,
+                    sorted_choices[np.clip(idx, 0, len(sorted_choices) - 1)],
+                    np.nan)
+
+
+def compute_aquifer_geometry(depth_to_base, target_idx, top_idx) -> tuple:
+    """
+    Computes the aquifer depths and thickness from layer positions in an aquifer layer table.
+
+    Works on a single well (integer positions) or a batch of wells sharing one layer table
+    (integer arrays of positions).
+
+    Parameters
+    ----------
+    depth_to_base : numpy.ndarray
+        The depth to the base of each aquifer layer, in table order.
+    target_idx : int or numpy.ndarray
+        Position(s) of the target aquifer layer. The layer below it must exist.
+    top_idx : int or numpy.ndarray
+        Position(s) of the top aquifer layer.
+
+    Returns
+    -------
+    tuple
+        (depth_to_top_screen, aquifer_thickness, depth_to_aquifer_base), scalars or arrays
+        matching the shape of the positions given.
+    """
+    depth_to_base = np.asarray(depth_to_base)
+    target_idx = np.asarray(target_idx)
+    depth_to_top_screen = depth_to_base[target_idx]
+    aquifer_thickness = depth_to_base[target_idx + 1] - depth_to_top_screen
+    depth_to_aquifer_base = depth_to_base[np.asarray(top_idx)]
+    return depth_to_top_screen, aquifer_thickness, depth_to_aquifer_base
 
 def query_diameter_table(val:float, 
                          table:pd.DataFrame, #wbd's drillling or casing table
@@ -99,23 +220,44 @@ def query_diameter_table(val:float,
         If the specified 'metric_column' does not exist in the table.
     IndexError
         If the 'query_param_column_id' is out of the DataFrame's column index range.
-    RuntimeError
-        If an unexpected error occurs during the query.
     """
+    lookup = _get_diameter_lookup(table, metric_column, query_param_column_id)
+    try:
+        return lookup[val]
+    except KeyError:
+        raise ValueError(f"No match found for value {val} in column '{metric_column}'") from None
+
+
+# per-table lookup dicts, keyed by id(table) and guarded by a weak reference to the table
+_DIAMETER_LOOKUP_CACHE: dict = {}
+
+
+def _get_diameter_lookup(table: pd.DataFrame, metric_column: str, query_param_column_id: int) -> dict:
+    """
+    Returns a dict mapping 'metric_column' values to the values of column 'query_param_column_id'.
+
+    The dict is built on first use and reused for later queries on the same table object.
+    Diameter tables are static reference data; a table modified in place after its first query
+    will keep returning the cached values.
+    """
+    cache_key = (id(table), metric_column, query_param_column_id)
+    cached = _DIAMETER_LOOKUP_CACHE.get(cache_key)
+    if cached is not None and cached[0]() is table:
+        return cached[1]
     try:
-        matching_row = table[table[metric_column] == val]
-        if matching_row.empty:
-            raise ValueError(f"No match found for value {val} in column '{metric_column}'")
-        recommended_bit = matching_row.iloc[0,query_param_column_id]
-        return recommended_bit        
+        keys = table[metric_column].to_numpy()
     except KeyError as e:
         raise KeyError(f"Column '{metric_column}' does not exist in the table. Details: {e}")
+    try:
+        values = table.iloc[:, query_param_column_id].to_numpy()
     except IndexError as e:
         raise IndexError(f"The DataFrame does not have a column {query_param_column_id+1}. Details: {e}")
-    except Exception as e:
-        raise RuntimeError(f"An unexpected error occurred: {e}")
-
-
+    lookup = {}
+    for key, value in zip(keys, values):
+        lookup.setdefault(key, value)  # first matching row wins, as with a row filter
+    table_ref = weakref.ref(table, lambda _: _DIAMETER_LOOKUP_CACHE.pop(cache_key, None))
+    _DIAMETER_LOOKUP_CACHE[cache_key] = (table_ref, lookup)
+    return lookup
 
 
 def check_casing_feasibility(casing_df:pd.DataFrame):
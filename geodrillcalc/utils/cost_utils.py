@@ -1,4 +1,5 @@
 import importlib.resources
+import numpy as np
 import pandas as pd
 import os
 
@@ -6,10 +7,10 @@ def calculate_costs_with_df(base_values: dict,
                             margin_functions: pd.DataFrame, 
                             index_labels: list) -> pd.DataFrame:
     """
-    Calculates the costs for different components using base values and margin functions.
+    Calculates the costs for different components using base values and margin parameters.
 
     This function generates a DataFrame with cost estimates for each component, including
-    low, base, and high estimates based on provided margin functions.
+    low, base, and high estimates based on the provided margin parameters.
 
     Parameters
     ----------
@@ -17,8 +18,8 @@ def calculate_costs_with_df(base_values: dict,
         A dictionary containing base cost values for each component. Keys are component names, 
         and values are the base costs.
     margin_functions : pandas.DataFrame
-        A DataFrame containing margin functions for calculating low and high cost estimates.
-        The DataFrame should have a MultiIndex with 'stage' and 'component' and columns 'low' and 'high'.
+        A DataFrame of margin parameters for a single stage, indexed by component, with the typed
+        columns 'low_coef', 'high_coef' and 'is_rate' as produced by populate_margin_functions.
     index_labels : list
         A list of component names to be used as the index for the resulting DataFrame.
 
@@ -30,31 +31,35 @@ def calculate_costs_with_df(base_values: dict,
 
     Notes
     -----
-    If a component does not have an associated margin function, the low and high costs will 
+    If a component does not have associated margin parameters, the low and high costs will 
     default to the base cost value.
     """
-    df = pd.DataFrame(columns=['low', 'base', 'high'], index=index_labels)
-
-    for label in index_labels:
-        base_value = base_values.get(label, 0)
-        df.at[label, 'base'] = base_value
-        if label in margin_functions.index:
-            low_func = margin_functions.at[label, 'low']
-            high_func = margin_functions.at[label, 'high']
-            df.at[label, 'low'] = low_func(base_value)
-            df.at[label, 'high'] = high_func(base_value)
-        else:
-            df.at[label, 'low'] = base_value
-            df.at[label, 'high'] = base_value
-
-    return df
+    labels = list(index_labels)
+    base = np.fromiter((base_values.get(label, 0) for label in labels), dtype=float, count=len(labels))
+    low = base.copy()
+    high = base.copy()
+
+    # gather the margin rows of the requested components; -1 marks components without margins
+    positions = margin_functions.index.get_indexer(labels)
+    found = positions >= 0
+    rows = positions[found]
+    is_rate = margin_functions['is_rate'].to_numpy(dtype=bool)[rows]
+    low_margin = margin_functions['low_coef'].to_numpy(dtype=float)[rows]
+    high_margin = margin_functions['high_coef'].to_numpy(dtype=float)[rows]
+    base_found = base[found]
+    low[found] = np.where(is_rate, base_found * low_margin, base_found + low_margin)
+    high[found] = np.where(is_rate, base_found * high_margin, base_found + high_margin)
+
+    return pd.DataFrame({'low': low, 'base': base, 'high': high}, index=labels)
+
+_MARGIN_TABLE_DTYPES = {'low_coef': np.float64, 'high_coef': np.float64, 'is_rate': bool}
 
 def populate_margin_functions(margin_dict: dict) -> pd.DataFrame:
     """
-    Creates a DataFrame of margin functions based on the provided margin dictionary.
+    Creates a DataFrame of margin parameters based on the provided margin dictionary.
 
-    This function builds a DataFrame that stores lambda functions for calculating 
-    low and high margins for cost estimates based on the input dictionary.
+    This function builds a DataFrame that stores, for each component, the low and high margins
+    for cost estimates and whether they are rates or fixed amounts.
 
     Parameters
     ----------
@@ -67,33 +72,32 @@ def populate_margin_functions(margin_dict: dict) -> pd.DataFrame:
     Returns
     -------
     pandas.DataFrame
-        A DataFrame indexed by a MultiIndex of 'stage' and 'component', with 'low' and 'high' 
-        columns containing lambda functions for calculating margins.
+        A DataFrame indexed by a MultiIndex of 'stage' and 'component', with the float64 columns
+        'low_coef' and 'high_coef' and the bool column 'is_rate'.
 
     Notes
     -----
-    The lambda functions stored in the DataFrame are used to calculate the low and high cost estimates
-    based on whether the margin is rate-based or an absolute value.
+    A rate-based margin multiplies the base cost, while a fixed margin is added to it.
+    The table holds plain numeric columns so that calculate_costs_with_df can apply the margins
+    with vectorised numpy operations.
     """
-    stages = list(margin_dict.keys())
-    components = [list(inner_dict.keys()) for inner_dict in margin_dict.values()]
-
-    # Pre-allocate the DataFrame with the correct MultiIndex for better performance
-    index = pd.MultiIndex.from_tuples(
-        [(stage, component) for stage, components_list in zip(stages, components) for component in components_list],
-        names=["stage", "component"]
-    )
-    pd1 = pd.DataFrame(index=index, columns=['low', 'high'])
-
+    # rows and index labels are collected in one pass and the DataFrame is built once
+    idx = []
+    rows = []
     for stage, inner_dict in margin_dict.items():
         for component, values in inner_dict.items():
-            for col in ['low', 'high']:
-                pd1.loc[(stage, component), col] = (
-                    lambda x, r=values, c=col: x * r[c] if r['is_rate_based'] else x + r[c]
-                )
+            idx.append((stage, component))
+            rows.append((float(values['low']), float(values['high']), bool(values['is_rate_based'])))
+
+    margin_table = pd.DataFrame(rows,
+                                columns=['low_coef', 'high_coef', 'is_rate'],
+                                index=pd.MultiIndex.from_tuples(idx, names=["stage", "component"]))
+    # enforce the column types, which pandas cannot infer for an empty table
+    return margin_table.astype(_MARGIN_TABLE_DTYPES)
 
-    return pd1
 
+# package data directory, resolved once at import
+_DATA_DIR = importlib.resources.files('geodrillcalc.data')
 
 def get_data_path(filename: str) -> str:
     """
@@ -115,14 +119,13 @@ def get_data_path(filename: str) -> str:
     Notes
     -----
     This function assumes that the 'data' directory is located one level above the directory
-    where this script is located.
+    where this script is located. The directory is resolved once, when the module is imported.
     """
     try:
-        data_path = importlib.resources.files('geodrillcalc.data') / filename
-        if not data_path.exists():
-            raise FileNotFoundError
-        return str(data_path)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"The file '{filename}' was not found in the 'data' directory.") from e
+        data_path = _DATA_DIR / filename
+        exists = data_path.exists()
     except Exception as e:
         raise RuntimeError(f"An unexpected error occurred while trying to access '{filename}'.") from e
+    if not exists:
+        raise FileNotFoundError(f"The file '{filename}' was not found in the 'data' directory.")
+    return str(data_path)
@@ -1,9 +1,24 @@
+import numpy as np
 import pandas as pd
 from .utils import getlogger
 
 logger = getlogger()
 
+_AQUIFER_TABLE_KEYS = frozenset(("aquifer_layer", "is_aquifer", "depth_to_base"))
+_PLAIN_COLUMN_TYPES = (list, tuple, np.ndarray)
+
 def initialise_aquifer_layer_table(aquifer_layer_table):
+        if (isinstance(aquifer_layer_table, dict) and aquifer_layer_table.keys() == _AQUIFER_TABLE_KEYS
+                and all(isinstance(column, _PLAIN_COLUMN_TYPES) for column in aquifer_layer_table.values())):
+            # column dicts of plain sequences in the documented layout are built indexed in a single construction;
+            # Series or dict columns carry their own labels and go through the generic path below
+            try:
+                return pd.DataFrame({"is_aquifer": aquifer_layer_table["is_aquifer"],
+                                     "depth_to_base": aquifer_layer_table["depth_to_base"]},
+                                    index=pd.Index(aquifer_layer_table["aquifer_layer"], name="aquifer_layer"))
+            except ValueError as e:
+                logger.error(e)
+                raise e
         if not isinstance(aquifer_layer_table, pd.DataFrame):
             try:
                 aquifer_layer_table_pd = pd.DataFrame(aquifer_layer_table)
@@ -11,9 +26,15 @@ def initialise_aquifer_layer_table(aquifer_layer_table):
                 logger.error(e)
                 raise e
         else:
-            aquifer_layer_table_pd = aquifer_layer_table.copy()
-        columns = ["aquifer_layer", "is_aquifer", "depth_to_base"]
-        aquifer_layer_table_pd.columns = columns
+            # a table already in the prepared layout is used as is
+            if (aquifer_layer_table.index.name == "aquifer_layer"
+                    and aquifer_layer_table.columns.tolist() == ["is_aquifer", "depth_to_base"]):
+                return aquifer_layer_table
+            aquifer_layer_table_pd = aquifer_layer_table
+        # set_index returns a new frame, so the columns can be renamed on it
+        # without copying or modifying the caller's table first
         aquifer_layer_table_pd = aquifer_layer_table_pd.set_index(
-            "aquifer_layer")
+            aquifer_layer_table_pd.columns[0])
+        aquifer_layer_table_pd.columns = ["is_aquifer", "depth_to_base"]
+        aquifer_layer_table_pd.index.name = "aquifer_layer"
         return aquifer_layer_table_pd
\ No newline at end of file
@@ -1,18 +1,25 @@
 #!/usr/bin/env python
 import pandas as pd
 import numpy as np
+import functools
 import logging
+import math
 
-logger=None
+logger = logging.getLogger(__name__)
+# the package configures root logging once, at import, unless the application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", datefmt="%H:%M:%S %d-%m-%Y")
 
 def getlogger(log_level='INFO') -> logging.Logger:
     """
-    Gets a pre-configured logger instance.
+    Gets the pre-configured package logger.
 
     Parameters
     ----------
     log_level : str, optional
-        The logging level as a string, default is 'INFO'. Possible values include 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'.
+        Kept for backward compatibility. Root logging is configured at INFO level when this module is imported,
+        so the argument has no effect; use logger.setLevel to change the level.
 
     Returns
     -------
@@ -21,14 +28,8 @@ def getlogger(log_level='INFO') -> logging.Logger:
 
     Notes
     -----
-    The logger instance is globally defined and will be re-used across multiple calls to avoid re-configuration.
+    The logger instance is created once at import and re-used across all calls.
     """
-    global logger
-    if logger is None:
-        logger = logging.getLogger(__name__)
-        numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-        logging.basicConfig(
-            level=numeric_level, format="%(asctime)s %(levelname)s %(message)s", datefmt="%H:%M:%S %d-%m-%Y")
     return logger
 
 
@@ -59,6 +60,7 @@ def serialize_results(obj, keys):
     -----
     - The function replaces NaN values with None to ensure JSON compatibility.
     - MultiIndex DataFrames are flattened and converted into a list of dictionaries.
+    - Single-indexed DataFrames are always returned as independent copies.
     """
     results = {}
     for key in keys:
@@ -66,18 +68,83 @@ def serialize_results(obj, keys):
         if isinstance(value, pd.DataFrame):
             # Handle double-indexed (MultiIndex) DataFrame
             if isinstance(value.index, pd.MultiIndex):
-                # Convert MultiIndex DataFrame to a dictionary and handle NaNs
-                value_dict = value.reset_index().replace(np.nan, None).to_dict(orient='records')
+                # Convert MultiIndex DataFrame to a list of records, then swap NaNs for None in place
+                value_dict = value.reset_index().to_dict(orient='records')
+                for record in value_dict:
+                    for name, cell in record.items():
+                        if isinstance(cell, float) and math.isnan(cell):
+                            record[name] = None
                 results[key] = value_dict
             else:
-                # Handle single-indexed DataFrame
-                value = value.replace(np.nan, None)
+                # Handle single-indexed DataFrame; the result never aliases the object's own frame.
+                # replace already returns a new frame, so only NaN-free frames need an explicit copy
+                if value.isna().to_numpy().any():
+                    value = value.replace(np.nan, None)
+                else:
+                    value = value.copy()
                 results[key] = value
         else:
             results[key] = value
     return results
 
 
+
+_FRAME_MARKER = '__pandas_frame__'
+
+def frames_to_components(results):
+    """
+    Recursively replaces single-dtype numeric DataFrames in exported results with their components.
+
+    Parameters
+    ----------
+    results : Any
+        Exported results, e.g. as returned by `export_results_to_dict`. Dictionaries are walked recursively.
+
+    Returns
+    -------
+    Any
+        The results with each eligible DataFrame replaced by a dictionary holding its 'index', 'columns'
+        and 2D 'data' array, tagged with the '__pandas_frame__' marker. Other values are returned unchanged.
+
+    Notes
+    -----
+    The component form pickles as a single contiguous buffer instead of a pandas block manager,
+    which makes it cheaper to send between processes. Use `components_to_frames` to restore the DataFrames.
+    Frames with MultiIndex, mixed or non-numeric columns are left as they are.
+    """
+    if isinstance(results, dict):
+        return {key: frames_to_components(value) for key, value in results.items()}
+    if (isinstance(results, pd.DataFrame)
+            and not isinstance(results.index, pd.MultiIndex)
+            and results.dtypes.nunique() == 1
+            and pd.api.types.is_numeric_dtype(results.dtypes.iloc[0])):
+        return {_FRAME_MARKER: True,
+                'index': results.index,
+                'columns': results.columns,
+                'data': results.to_numpy()}
+    return results
+
+
+def components_to_frames(results):
+    """
+    Inverse of `frames_to_components`: rebuilds the DataFrames from their components.
+
+    Parameters
+    ----------
+    results : Any
+        Results as returned by `frames_to_components`.
+
+    Returns
+    -------
+    Any
+        The results with every tagged component dictionary replaced by the original DataFrame.
+    """
+    if isinstance(results, dict):
+        if results.get(_FRAME_MARKER):
+            return pd.DataFrame(results['data'], index=results['index'], columns=results['columns'])
+        return {key: components_to_frames(value) for key, value in results.items()}
+    return results
+
 def get_all_non_boilerplate_attributes(cls):
     """Returns a list of all non-boilerplate attributes of the class.
 
@@ -94,8 +161,43 @@ def get_all_non_boilerplate_attributes(cls):
     Notes
     -----
     - The function excludes attributes starting with an underscore and certain standard attributes like '__class__' and '__module__'.
+    - The scan is done once per class; attributes added to the class afterwards are not picked up.
     """
+    return list(_non_boilerplate_attribute_names(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _non_boilerplate_attribute_names(cls) -> tuple:
     boilerplate_attribute_names = ["__class__", "__dict__", "__module__"]
-    attribute_names = [attr for attr in dir(cls) if not attr.startswith(
-        "_") and attr not in boilerplate_attribute_names]
-    return attribute_names
+    return tuple(attr for attr in dir(cls) if not attr.startswith(
+        "_") and attr not in boilerplate_attribute_names)
+
+
+def make_hashable(obj):
+    """Recursively converts a nested input structure into a hashable key.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to convert. Dictionaries, lists, tuples, numpy arrays and pandas DataFrames
+        are converted recursively; other values are returned unchanged.
+
+    Returns
+    -------
+    Any
+        A hashable representation of 'obj' that compares equal for equal inputs.
+
+    Notes
+    -----
+    - Dictionaries are converted into tuples of key-value pairs sorted by key, so key order does not matter.
+    - DataFrames are represented by their columns and per-row hashes from pd.util.hash_pandas_object.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((key, make_hashable(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(make_hashable(value) for value in obj)
+    if isinstance(obj, np.ndarray):
+        return tuple(obj.tolist())
+    if isinstance(obj, pd.DataFrame):
+        return (tuple(obj.columns), tuple(pd.util.hash_pandas_object(obj, index=True)))
+    return obj
@@ -6,6 +6,9 @@ from ..exceptions import (
     ShallowLTAError,
 )
 
+# aquifer layers accepted as the topmost layer of a bore
+_TOP_AQUIFER_ALLOWED = frozenset(('100qa', '102utqa'))
+
 def check_initial_calculation_feasibility(layer_df:pd.DataFrame,
                                           target_top_layers=None,
                                           target_layer='111lta'):
@@ -15,7 +18,7 @@ def check_initial_calculation_feasibility(layer_df:pd.DataFrame,
     Raises exceptions When the aquifer layer data is empty,
     """
     if target_top_layers is None:
-        target_top_layers = ['100qa', '102utqa']
+        target_top_layers = _TOP_AQUIFER_ALLOWED
 
     #data should not be empty
     layers = layer_df.index.tolist()
@@ -34,7 +37,7 @@ def check_initial_calculation_feasibility(layer_df:pd.DataFrame,
                  f"Top layer '{top_layer}' is too shallow to be drilled."
             )
         raise InvalidGroundwaterLayerError(
-            f"Top layer '{top_layer}' is invalid. Expected one of {target_top_layers}."
+            f"Top layer '{top_layer}' is invalid. Expected one of {sorted(target_top_layers)}."
         )
         #raise ValueError(f'Aquifer Validation Error: Top layer is {top_layer}, which is not an aquifer layer.')
 
@@ -43,8 +46,7 @@ def check_initial_calculation_feasibility(layer_df:pd.DataFrame,
         raise InvalidGroundwaterLayerError(f'Aquifer Validation Error: {target_layer} not present in the aquifer layers: {layers}')
     
     #target layer is not the bottommost layer
-    target_index=layer_df.index.get_loc(
-            target_layer)
+    target_index = layers.index(target_layer)
     if target_index >= len(layers) - 1:
         raise InvalidGroundwaterLayerError(
                  f"Target aquifer '{target_layer}' is the bottommost layer, which is an invalid design.")
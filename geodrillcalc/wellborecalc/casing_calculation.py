@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import math
 import numpy as np
+import pandas as pd
 
 from geodrillcalc.utils.calc_utils import find_next_largest_value
 from ..utils.utils import getlogger
@@ -390,6 +391,37 @@ def calculate_drill_bit_diameter(casing_stage_diameter: float,
     return np.nan
 
 
+def map_drill_bit_diameters(casing_stage_diameters: pd.Series,
+                            casing_to_drill_bit: dict) -> pd.Series:
+    """
+    Calculates the recommended drill bit diameters based on the casing stage diameters.
+
+    Parameters
+    ----------
+    casing_stage_diameters : pd.Series
+        Diameters of the casing stages.
+    casing_to_drill_bit : dict
+        Mapping of nominal casing diameters to their recommended drill bit diameters,
+        built from the 'metres' and 'recommended_bit' columns of the casing diameter table.
+
+    Returns
+    -------
+    pd.Series
+        Recommended drill bit diameters, aligned with 'casing_stage_diameters'.
+
+    Notes
+    -----
+    - This is the vectorised counterpart of calculate_drill_bit_diameter, looking up all casing stages at once.
+    - Stages without a casing diameter (np.nan) are left as np.nan.
+    - If a casing diameter has no matching entry, an error is logged and np.nan is returned for that stage.
+    """
+    drill_bits = casing_stage_diameters.map(casing_to_drill_bit)
+    if (drill_bits.isna() & casing_stage_diameters.notna()).any():
+        logger.error(
+            "Missing or non-matching values. Check arguments of map_drill_bit_diameters")
+    return drill_bits
+
+
 def calculate_screen_depths(depth_to_top_screen, screen_length, aquifer_thickness):
     """
     Calculates and returns the top and bottom depths of the screen.
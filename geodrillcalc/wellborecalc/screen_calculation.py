@@ -44,9 +44,9 @@ def is_water_corrosive(temperature_k: float,
     pKsc_coeff = [171.9065, 0.077993, 2839.319, 71.595, 0]
 
     pK2 = K_potenz(pK2_coeff, temperature_k)
-    logger.info(f'pk2: {pK2}')
+    logger.info('pk2: %s', pK2)
     pKsc = K_potenz(pKsc_coeff, temperature_k)
-    logger.info(f'pKsc: {pKsc}')
+    logger.info('pKsc: %s', pKsc)
     pCa2 = -np.log10(calcium_ion_concentration/(1000*40.08))
     pHCO3 = -np.log10(carbonate_ion_concentration/(1000*61.0168))
     ionic_strength = total_dissolved_solids/40000
@@ -135,11 +135,13 @@ def calculate_casing_friction(depth_to_top_screen: float,
 
     Returns
     -------
-    float
-        The calculated friction loss in metres.
+    float or np.ndarray
+        The calculated friction loss in metres, elementwise for array inputs.
     """
-    hfpc = (10.67*depth_to_top_screen*req_flow_rate**1.852) / \
-        (pipe_roughness_coeff**1.852 * casing_diameter**4.8704)
+    # scalar factor is evaluated once so that the array pass is a single power and multiply
+    coefficient = (10.67*depth_to_top_screen*req_flow_rate**1.852) / \
+        pipe_roughness_coeff**1.852
+    hfpc = coefficient * np.power(casing_diameter, -4.8704)
     return hfpc
 
 
@@ -167,30 +169,30 @@ def calculate_minimum_screen_diameter(up_hole_frictions: np.ndarray,
     np.ndarray
         Array of minimum screen diameters in metres. Returns np.nan for friction values that are too high.
     """
-    high_friction_mask = up_hole_frictions > 20
-
-    d = np.empty_like(up_hole_frictions, dtype=float)
-    d[~high_friction_mask] = ((10.67 * screen_length * req_flow_rate**1.852)
-                              / (2 * pipe_roughness_coeff**1.852 * (20 - up_hole_frictions[~high_friction_mask])))**(1/4.8704)
-
-    d[high_friction_mask] = np.nan
+    coefficient = (10.67 * screen_length * req_flow_rate**1.852) / \
+        (2 * pipe_roughness_coeff**1.852)
+    # high friction entries are masked out, so the invalid power they produce is ignored
+    with np.errstate(invalid='ignore'):
+        d = np.where(up_hole_frictions > 20,
+                     np.nan,
+                     (coefficient / (20 - up_hole_frictions))**(1/4.8704))
 
     return d
 
 
-def calculate_total_casing(prod_casing_diameter: float,
-                           screen_diameter,
+def calculate_total_casing(prod_casing_diameter: float | np.ndarray,
+                           screen_diameter: float | np.ndarray,
                            intermediate_casing: float,
                            screen_length: float
-                           ) -> float:
+                           ) -> float | np.ndarray:
     """
     Calculates the total casing length required, including production casing and screen, based on given parameters.
 
     Parameters
     ----------
-    prod_casing_diameter : float
+    prod_casing_diameter : float or np.ndarray
         Diameter of the production casing in metres.
-    screen_diameter : float
+    screen_diameter : float or np.ndarray
         Diameter of the screen in metres. If invalid or larger than the production casing diameter, np.nan is returned.
     intermediate_casing : float
         Length of intermediate casing in metres, typically measured from LMTA minus 10 metres.
@@ -199,24 +201,23 @@ def calculate_total_casing(prod_casing_diameter: float,
 
     Returns
     -------
-    float
-        Total length of casing required in metres. 
-        Returns np.nan if screen diameter is invalid or too large.
+    float or np.ndarray
+        Total length of casing required in metres, elementwise for array inputs.
+        Returns np.nan where the screen diameter is invalid or too large.
     """
+    prod_casing_diameter = np.asarray(prod_casing_diameter, dtype=float)
+    screen_diameter = np.asarray(screen_diameter, dtype=float)
 
-    nanflag = False
-    if prod_casing_diameter <= screen_diameter:
+    # NaN screen diameters also fail the comparison below
+    valid = prod_casing_diameter > screen_diameter
+    if not valid.all():
         logger.debug(
-            f"{prod_casing_diameter} <= {screen_diameter}: Production casing diameter must be greater than the screen diameter for a valid result.")
-        nanflag = True
-    if np.isnan(screen_diameter):
-        logger.debug("input is nan")
-        nanflag = True
-    if nanflag:
-        return np.nan
-    total_casing = intermediate_casing * np.pi * prod_casing_diameter + \
-        screen_length * np.pi * screen_diameter
-    return total_casing
+            "Production casing diameter must be greater than the screen diameter for a valid result.")
+    total_casing = np.where(valid,
+                            intermediate_casing * np.pi * prod_casing_diameter +
+                            screen_length * np.pi * screen_diameter,
+                            np.nan)
+    return total_casing if total_casing.ndim else float(total_casing)
 
 
 def calculate_minimum_open_hole_diameter(req_flow_rate_sec,
@@ -2,11 +2,12 @@
 import numpy as np
 import pandas as pd
 
-from geodrillcalc.utils.calc_utils import find_next_largest_value, query_diameter_table
+from geodrillcalc.utils.calc_utils import find_next_largest_vec
 from ..data_management.wellbore_data_store import WellBoreDataStore
 from . import casing_calculation as cc, pump_calculation as cp, screen_calculation as ci
 from ..utils.utils import getlogger
 from ..utils.calc_utils import check_casing_feasibility
+from ..exceptions import InvalidWellboreInputError
 
 #TODO: error messages: The algorithm is unable to design an appropriate bore for that location. Please choose another location.
 class CalcPipeline:
@@ -50,6 +51,12 @@ class CalcPipeline:
         calc_injectionpipe.calc_pipeline(is_production_well=True)
     """
 
+    # inputs the calculation stages divide by or take the logarithm of
+    _POSITIVE_INPUT_NAMES = ("required_flow_rate",
+                             "hydraulic_conductivity",
+                             "bore_lifetime_year",
+                             "aquifer_thickness")
+
     def __init__(self, wellboredict: WellBoreDataStore, logger=None):
         """
         Initialises the CalcPipeline class with a WellBoreDataStore instance.
@@ -67,8 +74,16 @@ class CalcPipeline:
             If the WellBoreDataStore instance is not ready for calculation.
         """
         self.wbd = wellboredict  # wellboredict must be a fully initialised instance
-        self.casing_diameters_in_metres = self.wbd.get_casing_diameters()
-        self.drilling_diameters_in_metres = self.wbd.get_drilling_diameters()
+        # nominal sizes sorted once so that next-size lookups can use binary search
+        self.casing_diameters_in_metres = np.sort(
+            np.asarray(self.wbd.get_casing_diameters(), dtype=np.float64))
+        self.drilling_diameters_in_metres = np.sort(
+            np.asarray(self.wbd.get_drilling_diameters(), dtype=np.float64))
+        # nominal size -> recommended size lookups, built from the data store's cached column arrays
+        self.casing_to_drill_bit = dict(zip(self.wbd.get_diameter_column('casing', 'metres').tolist(),
+                                            self.wbd.get_diameter_column('casing', 'recommended_bit').tolist()))
+        self.drill_bit_to_screen = dict(zip(self.wbd.get_diameter_column('drilling', 'metres').tolist(),
+                                            self.wbd.get_diameter_column('drilling', 'recommended_screen').tolist()))
         self.logger = logger or getlogger()
 
     def calc_pipeline(self):
@@ -80,39 +95,51 @@ class CalcPipeline:
 
         Raises
         ------
+        RuntimeError
+            If the WellBoreDataStore instance has not been initialised with input parameters.
+        InvalidWellboreInputError
+            If an input parameter lies outside its valid range.
         ValueError
             If an error occurs during any calculation stage.
-        ZeroDivisionError
-            If a zero division error occurs during interval calculations.
         """
-        logger = self.logger
-        try:
-
-            if not self.wbd.ready_for_calculation:
-                raise RuntimeError(
-                f"Input parameters must be assigned to WellBoreDataStore object before calling the current class {self.__name__}")
-            #validate wellbore design feasibility
-            #check_initial_calculation_feasibility(self.wbd.aquifer_layer_table)
-            
-            self.wbd.ready_for_installation_output = False
-            self._screen_pipeline()
-            self._pump_pipeline()
-            self._casing_pipeline()
-
-            #validate wellbore design output parameters
-            check_casing_feasibility(self.wbd.casing_stage_table)
-
-            self.wbd.ready_for_installation_output = True
-        except ValueError as e:
-            raise e
-        except ZeroDivisionError as e:
-            logger.error(
-                f"Zero division error occurred in interval calculations: {str(e)}")
-            raise ValueError from e
-
-    def _screen_pipeline(self):
+        if not self.wbd.ready_for_calculation:
+            raise RuntimeError(
+                f"Input parameters must be assigned to WellBoreDataStore object before calling the current class {type(self).__name__}")
+        self._validate_inputs()
+        #validate wellbore design feasibility
+        #check_initial_calculation_feasibility(self.wbd.aquifer_layer_table)
+
+        self.wbd.ready_for_installation_output = False
+        # screen and pump stages are independent; their results are assigned in one batch
+        params = self._screen_pipeline()
+        params.update(self._pump_pipeline())
+        self.wbd.assign_parameters('installation', **params)
+        self._casing_pipeline()
+
+        #validate wellbore design output parameters
+        check_casing_feasibility(self.wbd.casing_stage_table)
+
+        self.wbd.ready_for_installation_output = True
+
+    def _validate_inputs(self):
+        """
+        Checks the inputs that the calculation stages divide by or take the logarithm of.
+
+        Raises
+        ------
+        InvalidWellboreInputError
+            If any of the checked parameters is not strictly positive.
         """
-        Calculates and the following screen parameters in the WellBoreDataStore instance.
+        wbd = self.wbd
+        for name in self._POSITIVE_INPUT_NAMES:
+            value = getattr(wbd, name)
+            if not value > 0:
+                raise InvalidWellboreInputError(
+                    f"{name.replace('_', ' ').capitalize()} must be greater than zero, got {value}")
+
+    def _screen_pipeline(self) -> dict:
+        """
+        Calculates the following screen parameters for the WellBoreDataStore instance.
 
         Attributes
         ----------
@@ -129,6 +156,11 @@ class CalcPipeline:
         screen_stage_table : pd.DataFrame, optional
             A DataFrame containing the screen stage details, calculated for production wells.
 
+        Returns
+        -------
+        dict
+            The calculated screen parameters, keyed by attribute name.
+
         Notes
         -----
         For production wells, additional parameters such as `min_total_casing_production_screen_diameter`
@@ -137,84 +169,84 @@ class CalcPipeline:
 
         wbd = self.wbd  # fully initialised wellboredict instance
         ir = {}
-        drilling_diameter_list = wbd.get_drilling_diameters()
+        # inputs read more than once are bound to locals
+        is_production_well = wbd.is_production_well
+        req_flow_rate = wbd.required_flow_rate_per_m3_sec
+        depth_to_top_screen = wbd.depth_to_top_screen
+        pipe_roughness_coeff = wbd.pipe_roughness_coeff
 
-        ir['screen_length'], ir['screen_length_error'] = \
+        screen_length, screen_length_error = \
             ci.calculate_minimum_screen_length(wbd.required_flow_rate,
                                                wbd.hydraulic_conductivity,
                                                wbd.bore_lifetime_per_day,
                                                wbd.aquifer_thickness,
-                                               wbd.is_production_well)
-
-        if wbd.is_production_well:  # production pipeline
+                                               is_production_well)
+        # results are stored as plain floats rather than numpy scalars
+        ir['screen_length'] = float(screen_length)
+        ir['screen_length_error'] = tuple(float(e) for e in screen_length_error)
+
+        # minimum open hole diameter shares every input but the sand face velocity between well types
+        sand_face_velocity = wbd.sand_face_velocity_production if is_production_well \
+            else wbd.sand_face_velocity_injection
+        ohd_min = ci.calculate_minimum_open_hole_diameter(req_flow_rate,
+                                                          ir['screen_length'],
+                                                          sand_face_velocity,
+                                                          wbd.aquifer_average_porosity,
+                                                          wbd.net_to_gross_ratio_aquifer)
+        ohd = ci.calculate_open_hole_diameter(
+            ohd_min, self.drilling_diameters_in_metres)
+
+        if is_production_well:  # production pipeline
             # define and populates 3 associated parameters
-            screen_df = pd.DataFrame(self.casing_diameters_in_metres,
-                                     columns=['production_casing_diameters'])
-            screen_df['production_casing_frictions'] = \
-                ci.calculate_casing_friction(wbd.depth_to_top_screen,
-                                             wbd.required_flow_rate_per_m3_sec,
-                                             self.casing_diameters_in_metres,
-                                             wbd.pipe_roughness_coeff)
-
-            screen_df['production_minimum_screen_diameters'] = \
-                ci.calculate_minimum_screen_diameter(screen_df['production_casing_frictions'].to_numpy(),
+            casing_diameters = self.casing_diameters_in_metres
+            casing_frictions = \
+                ci.calculate_casing_friction(depth_to_top_screen,
+                                             req_flow_rate,
+                                             casing_diameters,
+                                             pipe_roughness_coeff)
+
+            minimum_screen_diameters = \
+                ci.calculate_minimum_screen_diameter(casing_frictions,
                                                      screen_length=ir['screen_length'],
-                                                     req_flow_rate=wbd.required_flow_rate_per_m3_sec,
-                                                     pipe_roughness_coeff=wbd.pipe_roughness_coeff
+                                                     req_flow_rate=req_flow_rate,
+                                                     pipe_roughness_coeff=pipe_roughness_coeff
                                                      )
 
-            screen_df['production_screen_diameters'] = \
-                screen_df.apply(lambda row: find_next_largest_value
-                                (row['production_minimum_screen_diameters'],
-                                 self.casing_diameters_in_metres)
-                                if not np.isnan(row['production_minimum_screen_diameters'])
-                                else np.nan,
-                                axis=1)
-            screen_df['total_casing'] =\
-                screen_df.apply(lambda row: ci.calculate_total_casing(row['production_casing_diameters'],
-                                                                      row['production_screen_diameters'],
-                                                                      wbd.depth_to_top_screen-10,
-                                                                      ir['screen_length']),
-                                axis=1)
+            screen_diameters = find_next_largest_vec(minimum_screen_diameters,
+                                                     self.casing_diameters_in_metres)
+            total_casing = ci.calculate_total_casing(casing_diameters,
+                                                     screen_diameters,
+                                                     depth_to_top_screen-10,
+                                                     ir['screen_length'])
+            if np.isnan(total_casing).all():
+                raise ValueError(
+                    "No feasible production screen diameter: total casing is undefined for every casing size")
             min_total_casing_production_screen_diameter = \
-                screen_df.iloc[screen_df['total_casing'].argmin(
-                    skipna=True)]['production_screen_diameters']
+                float(screen_diameters[np.nanargmin(total_casing)])
             ir['min_total_casing_production_screen_diameter'] = min_total_casing_production_screen_diameter
-            # stores the screen stage table to wbd
-            setattr(self.wbd, 'screen_stage_table', screen_df)
+            ir['screen_stage_table'] = pd.DataFrame({'production_casing_diameters': casing_diameters,
+                                                     'production_casing_frictions': casing_frictions,
+                                                     'production_minimum_screen_diameters': minimum_screen_diameters,
+                                                     'production_screen_diameters': screen_diameters,
+                                                     'total_casing': total_casing})
 
             screen_diameter = max(
                 min_total_casing_production_screen_diameter, self.casing_diameters_in_metres[0])
-            ohd_min = ci.calculate_minimum_open_hole_diameter(wbd.required_flow_rate_per_m3_sec,
-                                                              ir['screen_length'],
-                                                              wbd.sand_face_velocity_production,
-                                                              wbd.aquifer_average_porosity,
-                                                              wbd.net_to_gross_ratio_aquifer)
-            ohd = ci.calculate_open_hole_diameter(
-                ohd_min, drilling_diameter_list)
             ohd = ci.calibrate_open_hole_diameter(
                 ohd, screen_diameter, wbd.casing_diameter_table)
         else:  # injection pipeline
             # for the injection wells, the screen diameter depends on the open hole diameter
-            ohd_min = ci.calculate_minimum_open_hole_diameter(wbd.required_flow_rate_per_m3_sec,
-                                                              ir['screen_length'],
-                                                              wbd.sand_face_velocity_injection,
-                                                              wbd.aquifer_average_porosity,
-                                                              wbd.net_to_gross_ratio_aquifer)
-            ohd = ci.calculate_open_hole_diameter(
-                ohd_min, drilling_diameter_list)
-            screen_diameter = query_diameter_table(
-                ohd, wbd.drilling_diameter_table)
+            screen_diameter = self.drill_bit_to_screen[ohd]
             # screen_diameter of the injection well guaranteed to be greater than its open hole diameter
 
-        ir['screen_diameter'] = screen_diameter
-        ir['open_hole_diameter'] = ohd
-        wbd.assign_parameters('installation', **ir)
+        ir['screen_diameter'] = float(screen_diameter)
+        ir['open_hole_diameter'] = float(ohd)
+        return ir
 
 
-    def _pump_pipeline(self):
+    def _pump_pipeline(self) -> dict:
         """
-        Calculates and updates pump parameters in the WellBoreDataStore instance.
+        Calculates pump parameters for the WellBoreDataStore instance.
 
         Attributes
         ----------
@@ -223,9 +255,10 @@ class CalcPipeline:
         minimum_pump_housing_diameter : float
             The minimum diameter required for the pump housing.
 
-        Notes
-        -----
-        This method updates the WellBoreDataStore instance with the calculated pump parameters.
+        Returns
+        -------
+        dict
+            The calculated pump parameters, keyed by attribute name.
         """
 
         wbd = self.wbd
@@ -238,10 +271,10 @@ class CalcPipeline:
         pump_diameter = cp.assign_pump_diameter(
             wbd.required_flow_rate_per_litre_sec)
         pr['minimum_pump_housing_diameter'] =\
-            cp.calculate_minimum_pump_housing_diameter(wbd.required_flow_rate_per_m3_sec,
-                                                       pump_diameter
-                                                       )
-        wbd.assign_parameters('installation', **pr)
+            float(cp.calculate_minimum_pump_housing_diameter(wbd.required_flow_rate_per_m3_sec,
+                                                             pump_diameter
+                                                             ))
+        return pr
 
 
     def _casing_pipeline(self):
@@ -275,78 +308,86 @@ class CalcPipeline:
         """
         wbd = self.wbd
         logger = self.logger
-        casing_stage_table = wbd.casing_stage_table.copy().drop(
-            ['drill_bit'], axis=1)  # drill_bit column will be added in the last part
+        # stage rows are collected first and the table is built once at the end;
+        # the drill_bit column is added in the last part
+        casing_stage_rows = {}
+        unused_stage = [np.nan, np.nan, np.nan]
         is_production_well = wbd.is_production_well
 
         screen_diameter = wbd.screen_diameter
         screen_length = wbd.screen_length
+        depth_to_aquifer_base = wbd.depth_to_aquifer_base
+        depth_to_top_screen = wbd.depth_to_top_screen
+        minimum_pump_housing_diameter = wbd.minimum_pump_housing_diameter
+        casing_diameters_in_metres = self.casing_diameters_in_metres
 
         # ------pre-collar section
         pre_collar = [
-            *cc.calculate_pre_collar_depths(wbd.depth_to_aquifer_base),
+            *cc.calculate_pre_collar_depths(depth_to_aquifer_base),
             cc.calculate_pre_collar_casing_diameter()
         ]
-        casing_stage_table.loc['pre_collar'] = pre_collar
+        casing_stage_rows['pre_collar'] = pre_collar
 
 
         # ------pump chamber casing section
         intermediate_casing_diameter = screen_diameter
         separate_pump_chamber_required = cc.is_separate_pump_chamber_required(is_production_well,  # this is always false for injection wells
                                                                               intermediate_casing_diameter,
-                                                                              wbd.minimum_pump_housing_diameter)
-        logger.info(
-            f'separate_pump_chamber_required: {separate_pump_chamber_required}')
+                                                                              minimum_pump_housing_diameter)
+        logger.info('separate_pump_chamber_required: %s',
+                    separate_pump_chamber_required)
         if separate_pump_chamber_required:
             pump_chamber = [*cc.calculate_pump_chamber_depths(separate_pump_chamber_required,
                                                               wbd.pump_inlet_depth),
-                            cc.calculate_pump_chamber_diameter(wbd.minimum_pump_housing_diameter,
-                                                               self.casing_diameters_in_metres)]
-            casing_stage_table.loc['pump_chamber_casing'] = pump_chamber
+                            cc.calculate_pump_chamber_diameter(minimum_pump_housing_diameter,
+                                                               casing_diameters_in_metres)]
+            casing_stage_rows['pump_chamber_casing'] = pump_chamber
 
         # ------intermediate_casing section
-        intermediate_casing = [*cc.calculate_intermediate_casing_depths(wbd.depth_to_top_screen,
+        intermediate_casing = [*cc.calculate_intermediate_casing_depths(depth_to_top_screen,
                                                                         separate_pump_chamber_required,
-                                                                        casing_stage_table.loc['pump_chamber_casing']['bottom']),
+                                                                        casing_stage_rows.get('pump_chamber_casing', unused_stage)[1]),
                                cc.calculate_intermediate_casing_diameter(screen_diameter,
-                                                                         self.casing_diameters_in_metres,
+                                                                         casing_diameters_in_metres,
                                                                          wbd.min_total_casing_production_screen_diameter if is_production_well else 0,
                                                                          )]
-        casing_stage_table.loc['intermediate_casing'] = intermediate_casing
+        casing_stage_rows['intermediate_casing'] = intermediate_casing
 
         # ------superficial casing section
         superficial_casing_required = cc.is_superficial_casing_required(
-            wbd.depth_to_aquifer_base)
-        logger.info(
-            f'superficial_casing_required: {superficial_casing_required}')
+            depth_to_aquifer_base)
+        logger.info('superficial_casing_required: %s',
+                    superficial_casing_required)
 
         if superficial_casing_required:
             if separate_pump_chamber_required:
-                sc_diameter_seed = casing_stage_table.loc['pump_chamber_casing', 'casing']
+                sc_diameter_seed = casing_stage_rows['pump_chamber_casing'][2]
             else:
-                sc_diameter_seed = casing_stage_table.loc['intermediate_casing', 'casing']
+                sc_diameter_seed = casing_stage_rows['intermediate_casing'][2]
             #print(f'superficial_casing_diameter_seed: {sc_diameter_seed}, pump chamber required: {separate_pump_chamber_required}')
-            casing_stage_table.loc['superficial_casing'] = \
+            casing_stage_rows['superficial_casing'] = \
                 [*cc.calculate_superficial_casing_depths(superficial_casing_required,
-                                                         wbd.depth_to_aquifer_base),
+                                                         depth_to_aquifer_base),
                  cc.calculate_superficial_casing_diameter(is_superficial_casing_required=superficial_casing_required,
                                                           diameter=sc_diameter_seed,
-                                                          casing_diameters_in_metres=self.casing_diameters_in_metres
+                                                          casing_diameters_in_metres=casing_diameters_in_metres
                                                           )]
 
         # ------screen riser section
-        casing_stage_table.loc['screen_riser'] = [*cc.calculate_screen_riser_depths(wbd.depth_to_top_screen),
-                                                  cc.calculate_screen_riser_diameter(screen_diameter)]
+        casing_stage_rows['screen_riser'] = [*cc.calculate_screen_riser_depths(depth_to_top_screen),
+                                             cc.calculate_screen_riser_diameter(screen_diameter)]
         # ------screen section
-        casing_stage_table.loc['screen'] = [*cc.calculate_screen_depths(wbd.depth_to_top_screen,
-                                                                        screen_length,
-                                                                        wbd.aquifer_thickness),
-                                            screen_diameter]
-
-        casing_stage_table['drill_bit'] =\
-            casing_stage_table.apply(lambda row: cc.calculate_drill_bit_diameter
-                                     (row['casing'],
-                                      wbd.casing_diameter_table) if not np.isnan(row['casing']) else row['casing'],
-                                     axis=1)
+        casing_stage_rows['screen'] = [*cc.calculate_screen_depths(depth_to_top_screen,
+                                                                   screen_length,
+                                                                   wbd.aquifer_thickness),
+                                       screen_diameter]
+
+        casing_stage_table = pd.DataFrame.from_dict(casing_stage_rows,
+                                                    orient='index',
+                                                    columns=['top', 'bottom', 'casing'],
+                                                    dtype=float).reindex(WellBoreDataStore._CASING_STAGE_INDEX)
+        casing_stage_table['drill_bit'] = \
+            cc.map_drill_bit_diameters(casing_stage_table['casing'],
+                                       self.casing_to_drill_bit)
 
         setattr(wbd, 'casing_stage_table', casing_stage_table)
@@ -29,7 +29,7 @@ class CostStageCalculator:
     wellbore_params : dict
         Dictionary containing wellbore parameters required for cost calculations.
     margin_functions : pd.DataFrame
-        DataFrame containing margin functions used for cost calculations.
+        DataFrame containing the margin parameters used for cost calculations.
     stage_labels : list
         List of labels indicating the different stages of cost calculation.
     stage_calculators : dict
@@ -62,7 +62,7 @@ class CostStageCalculator:
         Returns cost rates specific to other miscellaneous costs.
 
     _initialise_margin_functions(margins_dict: dict) -> pd.DataFrame
-        Initialises margin functions based on provided margin rates.
+        Initialises the margin parameter table based on provided margin rates.
 
     calculate_drilling_components_cost() -> pd.DataFrame
         Calculates the costs associated with drilling components.
@@ -1,4 +1,5 @@
 import pandas as pd
+import functools
 import json
 from ..data_management.wellbore_data_store import WellBoreDataStore
 from .cost_parameter_extractor import CostParameterExtractor
@@ -7,6 +8,14 @@ from ..utils.utils import getlogger
 from ..utils.cost_utils import get_data_path
 
 logger = getlogger()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_fallback_file(filename: str) -> str:
+    # the packaged fallback files do not change at runtime, so each is read from disk once
+    with open(filename, 'r') as f:
+        return f.read()
+
 #TODO: upgrade validation logics for margin and cost rates
 
 class CostPipeline:
@@ -150,8 +159,8 @@ class CostPipeline:
         If the fallback file is not found, a warning is logged.
         """
         try:
-            with open(filename, 'r') as f:
-                fallback_rates = json.load(f)
+            # parsed on every call so each pipeline gets its own dicts; only the file read is cached
+            fallback_rates = json.loads(_read_fallback_file(filename))
             setattr(self, target_attribute, fallback_rates)
             logger.info(f"Using fallback {target_attribute} from {filename}")
         except FileNotFoundError:
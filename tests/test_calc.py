@@ -3,14 +3,11 @@ import pytest
 import pandas as pd
 
 import geodrillcalc.exceptions
-def test_pipeline():
-    import geodrillcalc.geodrillcalc_interface as gdc
-    from geodrillcalc.wellborecost.cost_parameter_extractor import CostParameterExtractor
-    from geodrillcalc.wellborecost.wellborecost_pipeline import CostPipeline
-    from geodrillcalc.wellborecost.cost_stage_calculator import CostStageCalculator
-    import json
 
-    aquifer_layer_table = {
+
+@pytest.fixture
+def aquifer_layer_table():
+    return {
         "aquifer_layer": [
             '100qa',
             #'103utqd',
@@ -44,7 +41,10 @@ def test_pipeline():
 
     }
 
-    initial_values = {
+
+@pytest.fixture
+def initial_values():
+    return {
         "required_flow_rate": 690,
         "hydraulic_conductivity": 5.5,
         "average_porosity": 0.25,
@@ -57,7 +57,15 @@ def test_pipeline():
         "top_aquifer_layer": "100qa"
     }
 
-    gci = gdc.GeoDrillCalcInterface()
+
+def test_pipeline(aquifer_layer_table, initial_values):
+    import geodrillcalc.geodrillcalc_interface as gdc
+    from geodrillcalc.wellborecost.cost_parameter_extractor import CostParameterExtractor
+    from geodrillcalc.wellborecost.wellborecost_pipeline import CostPipeline
+    from geodrillcalc.wellborecost.cost_stage_calculator import CostStageCalculator
+    import json
+
+    gci = gdc.GeoDrillCalcInterface(result_cache_size=32)
     gci.set_loglevel(4)
 
     wbd = gci.calculate_and_return_wellbore_parameters(True, # True for production, false for injection
@@ -71,6 +79,26 @@ def test_pipeline():
 
     result = wbd.export_results_to_dict()
     print(result)
+
+    # repeated inputs are served from the result cache as an independent copy
+    cached_wbd = gci.calculate_and_return_wellbore_parameters(True,
+                                                              aquifer_layer_table,
+                                                              initial_values)
+    assert cached_wbd is not wbd
+    assert gci.calcpl is None and gci.costpl is None
+    assert repr(cached_wbd.export_results_to_dict()) == repr(result)
+
+    # inputs of the previous run are not carried over when the store is reused
+    incomplete_values = dict(initial_values)
+    del incomplete_values['safety_margin']
+    with pytest.raises(ValueError):
+        gci.calculate_and_return_wellbore_parameters(True, aquifer_layer_table, incomplete_values)
+
+    # a zero-sized cache empties the memo and disables it
+    gci.result_cache_size = 0
+    assert not gci._result_cache
+    gci.calculate_and_return_wellbore_parameters(True, aquifer_layer_table, initial_values)
+    assert not gci._result_cache
     #print(js)
 
     # with open('geodrillcalc/data/fallback_cost_rates.json') as f:
@@ -100,3 +128,40 @@ def test_pipeline():
 
 
     #assert not wellbore_cost_calculator.cost_estimation_table.empty
+
+
+def test_calculate_batch(aquifer_layer_table, initial_values):
+    import geodrillcalc.geodrillcalc_interface as gdc
+
+    gci = gdc.GeoDrillCalcInterface()
+    results = gci.calculate_batch([(True, aquifer_layer_table, initial_values),
+                                   (False, aquifer_layer_table, initial_values)],
+                                  n_workers=2)
+    expected = gdc.GeoDrillCalcInterface().calculate_and_return_wellbore_parameters(
+        False, aquifer_layer_table, initial_values).export_results_to_dict()
+    assert len(results) == 2
+    assert repr(results[1]) == repr(expected)
+
+
+def test_invalid_input_raises(aquifer_layer_table, initial_values):
+    import geodrillcalc.geodrillcalc_interface as gdc
+    from geodrillcalc.exceptions import InvalidWellboreInputError
+
+    initial_values = dict(initial_values, required_flow_rate=0)
+    with pytest.raises(InvalidWellboreInputError):
+        gdc.GeoDrillCalcInterface().calculate_and_return_wellbore_parameters(
+            True, aquifer_layer_table, initial_values)
+
+
+def test_wellbore_data_store_slots():
+    import copy
+    from geodrillcalc.data_management.wellbore_data_store import WellBoreDataStore
+
+    wbd = WellBoreDataStore(True)
+    assert not hasattr(wbd, '__dict__')
+    # the per-instance caches live in slots as well
+    assert wbd.get_diameter_column('casing', 'metres') is wbd.get_casing_diameters()
+    assert wbd._aquifer_index_map is None
+    with pytest.raises(AttributeError):
+        wbd.misspelt_attribute = 1
+    assert copy.deepcopy(wbd).sand_face_velocity_production == wbd.sand_face_velocity_production
@@ -1,6 +1,53 @@
-from geodrillcalc.utils.calc_utils import find_next_largest_value
+import numpy as np
+import pandas as pd
+
+from geodrillcalc.utils.calc_utils import compute_aquifer_geometry, find_next_largest_value, find_next_largest_vec, find_nearest_value, nearest_batch
+from geodrillcalc.utils.data_preparation import initialise_aquifer_layer_table
+from geodrillcalc.utils.cost_utils import calculate_costs_with_df, populate_margin_functions
 
 def test_find_next_largest_value():
     values = [0.1, 0.2, 0.3, 0.5]
     assert find_next_largest_value(0.25, values) == 0.3
+    assert find_next_largest_value(0.15, np.array([0.5, 0.1, 0.3, 0.2])) == 0.2
+
+def test_find_next_largest_vec():
+    choices = np.array([0.1, 0.2, 0.3, 0.5])
+    result = find_next_largest_vec(np.array([0.25, 0.3, np.nan, 0.6]), choices)
+    np.testing.assert_array_equal(result, [0.3, 0.5, np.nan, np.nan])
+
+def test_nearest_batch():
+    choices = np.array([0.5, 0.1, 0.3, 0.2])
+    vals = np.array([0.2, 0.25, 0.6])
+    np.testing.assert_array_equal(nearest_batch(vals, choices), [0.2, 0.3, np.nan])
+    np.testing.assert_array_equal(nearest_batch(vals, choices, one_size_larger=True), [0.3, 0.3, np.nan])
+    np.testing.assert_array_equal(nearest_batch(vals, choices, larger_than_or_equal_val=False),
+                                  [find_nearest_value(v, choices, larger_than_or_equal_val=False) for v in vals])
+
+def test_calculate_costs_with_df():
+    margins = populate_margin_functions({'others': {'rate': {'low': 0.9, 'high': 1.1, 'is_rate_based': True},
+                                                    'fixed': {'low': -50, 'high': 50, 'is_rate_based': False}}})
+    costs = calculate_costs_with_df({'rate': 100, 'fixed': 100, 'unlisted': 100},
+                                    margins.loc['others'],
+                                    ['rate', 'fixed', 'unlisted'])
+    np.testing.assert_allclose(costs['low'], [90, 50, 100])
+    np.testing.assert_allclose(costs['high'], [110, 150, 100])
+
+def test_compute_aquifer_geometry():
+    depth_to_base = np.array([69, 182, 540, 552, 698, 898])
+    top, thickness, base = compute_aquifer_geometry(depth_to_base, np.array([3, 1]), np.array([0, 0]))
+    np.testing.assert_array_equal(top, [552, 182])
+    np.testing.assert_array_equal(thickness, [146, 358])
+    np.testing.assert_array_equal(base, [69, 69])
+    assert compute_aquifer_geometry(depth_to_base, 3, 0) == (552, 146, 69)
 
+def test_initialise_aquifer_layer_table():
+    raw = {'aquifer_layer': ['100qa', '109lmta'], 'is_aquifer': [True, False], 'depth_to_base': [69, 552]}
+    table = initialise_aquifer_layer_table(raw)
+    assert table.index.name == 'aquifer_layer'
+    assert table.columns.tolist() == ['is_aquifer', 'depth_to_base']
+    # an already prepared table is passed through without being rebuilt
+    assert initialise_aquifer_layer_table(table) is table
+    # dicts exported from a DataFrame carry their own row labels
+    frame = pd.DataFrame(raw)
+    for exported in (frame.to_dict(), frame.to_dict('series')):
+        pd.testing.assert_frame_equal(initialise_aquifer_layer_table(exported), table)